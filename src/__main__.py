@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import sys
 from pathlib import Path
 
 from loguru import logger
@@ -18,11 +19,9 @@ def configure_logging(config: AppConfig, verbose: bool = False) -> None:
         level=level,
         rotation="5 MB",
         retention=10,
-        enqueue=True,
         backtrace=True,
-        diagnose=True,
     )
-    logger.add(lambda msg: print(msg, end=""), level=level, colorize=False)
+    logger.add(sys.stderr, level=level, colorize=False)
 
 
 def parse_args() -> argparse.Namespace:
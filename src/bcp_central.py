@@ -1,15 +1,25 @@
 import argparse
 import asyncio
+import functools
 import logging
 import os
 import re
+import string
+import weakref
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
-from urllib.parse import quote_plus
+from typing import List, Optional, Tuple
+from urllib.parse import quote_plus, urljoin, urlsplit
 
 from dotenv import load_dotenv
-from playwright.async_api import Browser, Page, async_playwright
+from playwright.async_api import (
+    Browser,
+    BrowserContext,
+    Error as PlaywrightError,
+    Locator,
+    Page,
+    async_playwright,
+)
 
 load_dotenv()
 
@@ -21,9 +31,17 @@ DEFAULT_REPORTS = [
 ROOT_DIR = Path(__file__).parent.resolve()
 OUTPUT_DIR = Path(os.getenv("OUTPUT_DIR", ROOT_DIR / "downloads")).resolve()
 LOG_DIR = Path(os.getenv("LOG_DIR", ROOT_DIR / "logs")).resolve()
+STATE_PATH = Path(os.getenv("STATE_PATH", ROOT_DIR / "state.json")).resolve()
 HEADLESS_ENV = os.getenv("HEADLESS", "true").lower() != "false"
 NAVIGATION_TIMEOUT_MS = int(os.getenv("NAVIGATION_TIMEOUT_MS", "45000"))
+CONCURRENCY = int(os.getenv("CONCURRENCY", "6"))
+SAVE_CONCURRENCY = int(os.getenv("SAVE_CONCURRENCY", "8"))
+SKIP_IF_EXISTS = os.getenv("SKIP_IF_EXISTS", "true").lower() != "false"
+DIRECT_DOWNLOAD_SUFFIXES = frozenset({".csv", ".xls", ".xlsx", ".geojson", ".kml", ".kmz"})
+RETRY_ATTEMPTS = int(os.getenv("RETRY_ATTEMPTS", "3"))
+RETRY_BACKOFF_SECONDS = float(os.getenv("RETRY_BACKOFF_SECONDS", "0.5"))
 BASE_URL = os.getenv("PORTAL_BASE_URL", "https://www.data.gov.in/")
+REPORTS_ENV = os.getenv("REPORTS", "")
 SEARCH_TEMPLATE = os.getenv(
     "PORTAL_SEARCH_URL",
     "https://www.data.gov.in/search?query={query}",
@@ -34,11 +52,37 @@ RESOURCE_SELECTOR = os.getenv(
     'a[href$=".geojson"], a[href$=".kml"], a[href$=".kmz"], '
     'a.download-resource, a.btn.btn-primary[href]',
 )
+_HAS_QUERY_PLACEHOLDER = "{query}" in SEARCH_TEMPLATE
+RESOURCE_SELECTOR_CSS = f":is({RESOURCE_SELECTOR})" if "," in RESOURCE_SELECTOR else RESOURCE_SELECTOR
 RESOURCE_PRE_CLICK_SELECTOR = os.getenv("RESOURCE_PRE_CLICK_SELECTOR")
+RESULT_LIST_SELECTOR = os.getenv("RESULT_LIST_SELECTOR", "a")
+BLOCK_RESOURCES = frozenset(
+    part.strip()
+    for part in os.getenv("BLOCK_RESOURCES", "image,font,media,stylesheet").split(",")
+    if part.strip()
+)
 SEARCH_INPUT_SELECTOR = os.getenv("SEARCH_INPUT_SELECTOR")
 SEARCH_SUBMIT_SELECTOR = os.getenv("SEARCH_SUBMIT_SELECTOR")
 logger = logging.getLogger("dataset_downloader")
 
+_SLUG_RE = re.compile(r"[^a-zA-Z0-9]+")
+_SLUG_KEEP = frozenset(string.ascii_lowercase + string.digits)
+_SLUG_TABLE = str.maketrans(
+    {char: (char.lower() if char.lower() in _SLUG_KEEP else "-") for char in map(chr, range(256))}
+)
+_DASH_RUN_RE = re.compile(r"-{2,}")
+_save_semaphore = asyncio.Semaphore(SAVE_CONCURRENCY)
+_resource_locators: "weakref.WeakKeyDictionary[Page, Locator]" = weakref.WeakKeyDictionary()
+
+
+def resource_locator(page: Page) -> Locator:
+    """Return the page's cached locator for downloadable resource links."""
+    locator = _resource_locators.get(page)
+    if locator is None:
+        locator = page.locator(RESOURCE_SELECTOR_CSS)
+        _resource_locators[page] = locator
+    return locator
+
 LOGIN_CONFIG = {
     "url": os.getenv("PORTAL_LOGIN_URL"),
     "username": os.getenv("PORTAL_USERNAME"),
@@ -48,6 +92,10 @@ LOGIN_CONFIG = {
     "submit_selector": os.getenv("PORTAL_SUBMIT_SELECTOR"),
     "post_login_selector": os.getenv("PORTAL_POST_LOGIN_SELECTOR"),
 }
+LOGIN_READY = all(
+    LOGIN_CONFIG[key]
+    for key in ("url", "username", "password", "username_selector", "password_selector", "submit_selector")
+)
 
 
 def setup_logging() -> Path:
@@ -71,25 +119,31 @@ def setup_logging() -> Path:
 
 def parse_reports(cli_reports: List[str]) -> List[str]:
     """Merge CLI report names with .env defaults while preserving order."""
-    env_reports = [part.strip() for part in os.getenv("REPORTS", "").split("|") if part.strip()]
+    if cli_reports and not REPORTS_ENV:
+        return list(dict.fromkeys(cli_reports))
+    env_reports = [part.strip() for part in REPORTS_ENV.split("|") if part.strip()]
     combined = [*cli_reports, *env_reports]
     if combined:
         return list(dict.fromkeys(combined))
     return DEFAULT_REPORTS
 
 
+@functools.lru_cache(maxsize=1024)
 def build_search_url(query: str) -> str:
     """Convert a dataset title into a portal-specific search URL."""
     encoded = quote_plus(query)
-    if "{query}" in SEARCH_TEMPLATE:
+    if _HAS_QUERY_PLACEHOLDER:
         return SEARCH_TEMPLATE.replace("{query}", encoded)
     return f"{SEARCH_TEMPLATE}{encoded}"
 
 
 def sanitize_filename(label: str) -> str:
     """Slugify dataset titles so saved files have filesystem-safe names."""
-    slug = re.sub(r"[^a-zA-Z0-9]+", "-", label).strip("-")
-    return slug.lower() or "report"
+    slug = label.translate(_SLUG_TABLE)
+    if not slug.isascii():  # the table only covers Latin-1 code points
+        slug = _SLUG_RE.sub("-", slug)
+    slug = _DASH_RUN_RE.sub("-", slug).strip("-")
+    return slug or "report"
 
 
 def ensure_output_dir() -> None:
@@ -97,23 +151,44 @@ def ensure_output_dir() -> None:
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
 
+async def retry_with_backoff(operation, attempts: int = RETRY_ATTEMPTS, base_delay: float = RETRY_BACKOFF_SECONDS):
+    """Run a coroutine factory, retrying transient Playwright errors with backoff."""
+    for attempt in range(attempts):
+        try:
+            return await operation()
+        except PlaywrightError as exc:
+            if attempt == attempts - 1:
+                raise
+            delay = base_delay * (2 ** attempt)
+            logger.warning("[retry] Attempt %s failed (%s); retrying in %.1fs", attempt + 1, exc, delay)
+            await asyncio.sleep(delay)
+
+
+async def block_heavy_resources(context: BrowserContext) -> None:
+    """Abort requests for resource types the automation never inspects."""
+    if not BLOCK_RESOURCES:
+        return
+
+    async def _route(route, request):
+        if request.resource_type in BLOCK_RESOURCES:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    await context.route("**/*", _route)
+
+
 async def perform_login(page: Page) -> bool:
     """Optionally authenticate on the portal when login settings are provided."""
-    if not LOGIN_CONFIG.get("url"):
+    if not LOGIN_READY:
+        if LOGIN_CONFIG["url"]:
+            logger.warning("[login] Skipped: incomplete login configuration")
         return False
 
-    required = [
-        LOGIN_CONFIG.get("username_selector"),
-        LOGIN_CONFIG.get("password_selector"),
-        LOGIN_CONFIG.get("submit_selector"),
-    ]
-    if any(not selector for selector in required):
-        logger.warning("[login] Skipped: missing selectors in configuration")
-        return False
-
-    if not LOGIN_CONFIG.get("username") or not LOGIN_CONFIG.get("password"):
-        logger.warning("[login] Skipped: missing credentials")
-        return False
+    post_login_selector = LOGIN_CONFIG.get("post_login_selector")
+    if post_login_selector and await page.locator(post_login_selector).count() > 0:
+        logger.info("[login] Reusing session restored from saved state")
+        return True
 
     await page.goto(LOGIN_CONFIG["url"], wait_until="domcontentloaded", timeout=NAVIGATION_TIMEOUT_MS)
     await page.fill(LOGIN_CONFIG["username_selector"], LOGIN_CONFIG["username"])
@@ -127,6 +202,13 @@ async def perform_login(page: Page) -> bool:
     return True
 
 
+@functools.lru_cache(maxsize=512)
+def build_exact_regex(title: str) -> re.Pattern:
+    """Compile (and cache) the case-insensitive literal match for a title."""
+    return re.compile(re.escape(title), re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=512)
 def build_fuzzy_regex(title: str) -> re.Pattern:
     """Generate a loose regex that tolerates partial matches in link text."""
     tokens = [re.escape(token) for token in title.split() if token]
@@ -136,46 +218,56 @@ def build_fuzzy_regex(title: str) -> re.Pattern:
     return re.compile(pattern, re.IGNORECASE)
 
 
-async def find_dataset_link(page: Page, report_title: str):
-    """Return a locator pointing at the best matching dataset anchor tag."""
-    exact_regex = re.compile(re.escape(report_title), re.IGNORECASE)
-    locator = page.locator("a").filter(has_text=exact_regex).first
-    if await locator.count() > 0:
-        return locator
+_FIND_LINK_JS = """
+([exact, fuzzy]) => {
+    const anchors = [...document.querySelectorAll("a")];
+    const exactRe = new RegExp(exact, "i");
+    const fuzzyRe = new RegExp(fuzzy, "i");
+    const hit =
+        anchors.find((a) => exactRe.test(a.innerText)) ||
+        anchors.find((a) => fuzzyRe.test(a.innerText));
+    return hit ? hit.getAttribute("href") : null;
+}
+"""
 
-    fuzzy_regex = build_fuzzy_regex(report_title)
-    locator = page.locator("a").filter(has_text=fuzzy_regex).first
-    if await locator.count() > 0:
-        return locator
 
-    raise RuntimeError("Dataset link not found in search results")
+async def find_dataset_link(page: Page, report_title: str):
+    """Return a locator pointing at the best matching dataset anchor tag."""
+    exact_pattern = build_exact_regex(report_title).pattern
+    fuzzy_pattern = build_fuzzy_regex(report_title).pattern
+    href = await page.evaluate(_FIND_LINK_JS, [exact_pattern, fuzzy_pattern])
+    if not href:
+        raise RuntimeError("Dataset link not found in search results")
+    return page.locator(f'a[href="{href}"]').first
 
 
 async def open_dataset(page: Page, report_title: str) -> None:
     """Click the located dataset entry and wait for its detail page to load."""
-    await page.wait_for_timeout(1000)
     locator = await find_dataset_link(page, report_title)
     async with page.expect_navigation(wait_until="domcontentloaded", timeout=NAVIGATION_TIMEOUT_MS):
         await locator.click(timeout=NAVIGATION_TIMEOUT_MS)
-    await page.wait_for_load_state("networkidle", timeout=NAVIGATION_TIMEOUT_MS)
+    await page.wait_for_selector(RESOURCE_SELECTOR_CSS, state="attached", timeout=NAVIGATION_TIMEOUT_MS)
 
 
 async def search_for_report(page: Page, report_title: str) -> None:
     """Navigate to the search results for a title, then open the dataset page."""
     if SEARCH_INPUT_SELECTOR:
-        await page.goto(BASE_URL, wait_until="domcontentloaded", timeout=NAVIGATION_TIMEOUT_MS)
+        await retry_with_backoff(
+            lambda: page.goto(BASE_URL, wait_until="domcontentloaded", timeout=NAVIGATION_TIMEOUT_MS)
+        )
         await page.wait_for_selector(SEARCH_INPUT_SELECTOR, timeout=NAVIGATION_TIMEOUT_MS)
         await page.fill(SEARCH_INPUT_SELECTOR, report_title)
         if SEARCH_SUBMIT_SELECTOR:
             await page.click(SEARCH_SUBMIT_SELECTOR, timeout=NAVIGATION_TIMEOUT_MS)
         else:
             await page.keyboard.press("Enter")
-        await page.wait_for_load_state("domcontentloaded", timeout=NAVIGATION_TIMEOUT_MS)
-        await page.wait_for_load_state("networkidle", timeout=NAVIGATION_TIMEOUT_MS)
+        await page.wait_for_selector(RESULT_LIST_SELECTOR, state="attached", timeout=NAVIGATION_TIMEOUT_MS)
     else:
         search_url = build_search_url(report_title)
-        await page.goto(search_url, wait_until="domcontentloaded", timeout=NAVIGATION_TIMEOUT_MS)
-        await page.wait_for_load_state("networkidle", timeout=NAVIGATION_TIMEOUT_MS)
+        await retry_with_backoff(
+            lambda: page.goto(search_url, wait_until="domcontentloaded", timeout=NAVIGATION_TIMEOUT_MS)
+        )
+        await page.wait_for_selector(RESULT_LIST_SELECTOR, state="attached", timeout=NAVIGATION_TIMEOUT_MS)
     await open_dataset(page, report_title)
 
 
@@ -188,12 +280,68 @@ def build_destination_filename(suggested: str, fallback_title: str) -> str:
     return f"{safe_stem}{suffix or '.dat'}"
 
 
-async def download_resource(page: Page, report_title: str) -> Path:
-    """Click the first matching resource link and persist the resulting download."""
-    locator = page.locator(RESOURCE_SELECTOR)
+async def find_cached_destination(page: Page, target, report_title: str) -> Optional[Path]:
+    """Return an existing destination whose size matches the server's Content-Length."""
+    href = await target.get_attribute("href")
+    if not href:
+        return None
+    url = urljoin(page.url, href)
+    suggested = Path(urlsplit(url).path).name
+    destination = OUTPUT_DIR / build_destination_filename(suggested, report_title)
+    if not destination.exists():
+        return None
+    try:
+        response = await page.request.head(url)
+    except Exception:
+        return None
+    content_length = response.headers.get("content-length")
+    if content_length and destination.stat().st_size == int(content_length):
+        return destination
+    return None
+
+
+async def _save_download(download, destination: Path) -> None:
+    """Persist a download under the disk-concurrency cap."""
+    async with _save_semaphore:
+        staged = Path(await download.path())
+        try:
+            # Rename Playwright's staged temp file in place — zero-copy when
+            # the temp dir and OUTPUT_DIR share a filesystem.
+            os.replace(staged, destination)
+        except OSError:
+            await download.save_as(destination)
+
+
+async def _fetch_resource(page: Page, url: str, destination: Path) -> None:
+    """Fetch a resource straight over HTTP, reusing the context's cookies."""
+    async with _save_semaphore:
+        response = await page.request.get(url)
+        if not response.ok:
+            raise RuntimeError(f"Direct download failed with HTTP {response.status}: {url}")
+        destination.write_bytes(await response.body())
+
+
+async def download_resource(page: Page, report_title: str) -> Tuple[Path, Optional["asyncio.Task[None]"]]:
+    """Click the first matching resource link and schedule the download write."""
+    locator = resource_locator(page)
     if await locator.count() == 0:
         raise RuntimeError("No downloadable resources detected")
 
+    if SKIP_IF_EXISTS:
+        cached = await find_cached_destination(page, locator.first, report_title)
+        if cached is not None:
+            logger.info("[report] Skipping download, cached copy at %s", cached)
+            return cached, None
+
+    href = await locator.first.get_attribute("href")
+    if href:
+        url = urljoin(page.url, href)
+        url_path = Path(urlsplit(url).path)
+        if url_path.suffix.lower() in DIRECT_DOWNLOAD_SUFFIXES:
+            destination = OUTPUT_DIR / build_destination_filename(url_path.name, report_title)
+            logger.info("[report] Fetching resource directly: %s", url)
+            return destination, asyncio.create_task(_fetch_resource(page, url, destination))
+
     if RESOURCE_PRE_CLICK_SELECTOR:
         toggle_locator = page.locator(RESOURCE_PRE_CLICK_SELECTOR)
         if await toggle_locator.count() > 0:
@@ -204,24 +352,50 @@ async def download_resource(page: Page, report_title: str) -> Path:
     if handle is None:
         raise RuntimeError("Download link became unavailable before clicking")
 
-    async with page.expect_download(timeout=NAVIGATION_TIMEOUT_MS) as download_info:
-        await handle.evaluate("el => el.click()")
-    download = await download_info.value
+    async def _trigger_download():
+        async with page.expect_download(timeout=NAVIGATION_TIMEOUT_MS) as download_info:
+            await handle.evaluate("el => el.click()")
+        return await download_info.value
+
+    download = await retry_with_backoff(_trigger_download)
     suggested = download.suggested_filename or f"{sanitize_filename(report_title)}.dat"
     destination = OUTPUT_DIR / build_destination_filename(suggested, report_title)
     if destination.exists():
         destination.unlink()
-    await download.save_as(destination)
-    return destination
+    save_task = asyncio.create_task(_save_download(download, destination))
+    return destination, save_task
 
 
-async def process_report(page: Page, report_title: str) -> Optional[Path]:
-    """Search, open, and download a single dataset; return the saved path."""
+async def _release_page(page_pool: "asyncio.Queue[Page]", page: Page) -> None:
+    """Reset a worker page and return it to the pool for reuse."""
+    try:
+        await page.goto("about:blank")
+    except PlaywrightError:
+        page = await page.context.new_page()
+    await page_pool.put(page)
+
+
+async def process_report(page_pool: "asyncio.Queue[Page]", report_title: str) -> "asyncio.Task[Path]":
+    """Search, open, and start downloading a dataset; return the pending save task."""
     logger.info("[report] Processing: %s", report_title)
-    await search_for_report(page, report_title)
-    path = await download_resource(page, report_title)
-    logger.info("[report] Saved to %s", path)
-    return path
+    page = await page_pool.get()
+    try:
+        await search_for_report(page, report_title)
+        destination, save_task = await download_resource(page, report_title)
+    except Exception:
+        await _release_page(page_pool, page)
+        raise
+
+    async def _finalize() -> Path:
+        try:
+            if save_task is not None:
+                await save_task
+        finally:
+            await _release_page(page_pool, page)
+        logger.info("[report] Saved to %s", destination)
+        return destination
+
+    return asyncio.create_task(_finalize())
 
 
 async def run_automation(reports: List[str], headless: bool) -> None:
@@ -229,20 +403,47 @@ async def run_automation(reports: List[str], headless: bool) -> None:
     ensure_output_dir()
     async with async_playwright() as p:
         browser: Browser = await p.chromium.launch(headless=headless)
-        context = await browser.new_context(accept_downloads=True)
+        context = await browser.new_context(
+            accept_downloads=True,
+            storage_state=str(STATE_PATH) if STATE_PATH.exists() else None,
+        )
+        await block_heavy_resources(context)
         page = await context.new_page()
         await page.goto(BASE_URL, wait_until="domcontentloaded", timeout=NAVIGATION_TIMEOUT_MS)
-        await page.wait_for_timeout(500)
 
-        await perform_login(page)
+        if await perform_login(page):
+            await context.storage_state(path=str(STATE_PATH))
+        await page.close()
+
+        page_pool: "asyncio.Queue[Page]" = asyncio.Queue()
+        for _ in range(max(1, min(CONCURRENCY, len(reports)))):
+            page_pool.put_nowait(await context.new_page())
+
+        semaphore = asyncio.Semaphore(CONCURRENCY)
+
+        async def bounded_process(report_title: str) -> "asyncio.Task[Path]":
+            async with semaphore:
+                return await process_report(page_pool, report_title)
+
+        tasks = [asyncio.create_task(bounded_process(report)) for report in reports]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
 
         failures = []
-        for report in reports:
-            try:
-                await process_report(page, report)
-            except Exception as exc:
-                failures.append((report, str(exc)))
-                logger.exception("[report] Failed %s: %s", report, exc)
+        pending_saves: List[Tuple[str, "asyncio.Task[Path]"]] = []
+        for report, result in zip(reports, results):
+            if isinstance(result, BaseException):
+                failures.append((report, str(result)))
+                logger.error("[report] Failed %s: %s", report, result)
+            else:
+                pending_saves.append((report, result))
+
+        save_results = await asyncio.gather(
+            *(task for _, task in pending_saves), return_exceptions=True
+        )
+        for (report, _), result in zip(pending_saves, save_results):
+            if isinstance(result, BaseException):
+                failures.append((report, str(result)))
+                logger.error("[report] Failed to save %s: %s", report, result)
 
         await browser.close()
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import AsyncIterator, Optional
@@ -17,6 +18,8 @@ class BrowserManager:
         self.config = config
         self._playwright = None
         self._browser: Optional[Browser] = None
+        self._context: Optional[BrowserContext] = None
+        self._page_pool: "asyncio.Queue[Page]" = asyncio.Queue()
 
     async def start(self) -> None:
         if self._playwright is None:
@@ -27,6 +30,10 @@ class BrowserManager:
             )
 
     async def stop(self) -> None:
+        self._page_pool = asyncio.Queue()
+        if self._context:
+            await self._context.close()
+            self._context = None
         if self._browser:
             await self._browser.close()
             self._browser = None
@@ -34,8 +41,7 @@ class BrowserManager:
             await self._playwright.stop()
             self._playwright = None
 
-    @asynccontextmanager
-    async def context(self, download_dir: Path) -> AsyncIterator[BrowserContext]:
+    async def _new_context(self, download_dir: Path) -> BrowserContext:
         if not self._browser:
             await self.start()
         assert self._browser is not None
@@ -50,16 +56,53 @@ class BrowserManager:
         )
         context.set_default_timeout(self.config.browser.download_wait_seconds * 1000)
         context.set_default_navigation_timeout(self.config.browser.download_wait_seconds * 1000)
+        await self._block_resources(context)
+        return context
+
+    @asynccontextmanager
+    async def context(self, download_dir: Path) -> AsyncIterator[BrowserContext]:
+        context = await self._new_context(download_dir)
         try:
             yield context
         finally:
             await context.close()
 
+    async def shared_context(self, download_dir: Path) -> BrowserContext:
+        """Return the lazily created context shared by all worker pages."""
+        if self._context is None:
+            self._context = await self._new_context(download_dir)
+        return self._context
+
+    async def _block_resources(self, context: BrowserContext) -> None:
+        """Abort requests for resource types the automation never inspects."""
+        blocked = self.config.browser.blocked_resource_types
+        if not blocked:
+            return
+
+        async def _route(route, request):
+            if request.resource_type in blocked:
+                await route.abort()
+            else:
+                await route.continue_()
+
+        await context.route("**/*", _route)
+
+    async def acquire_page(self, download_dir: Path) -> Page:
+        """Take a pooled worker page, creating one on demand."""
+        if self._page_pool.empty():
+            ctx = await self.shared_context(download_dir)
+            return await ctx.new_page()
+        return await self._page_pool.get()
+
+    async def release_page(self, page: Page) -> None:
+        """Reset a worker page and return it to the pool for reuse."""
+        await page.goto("about:blank")
+        await self._page_pool.put(page)
+
     @asynccontextmanager
     async def page(self, download_dir: Path) -> AsyncIterator[Page]:
-        async with self.context(download_dir) as ctx:
-            page = await ctx.new_page()
-            try:
-                yield page
-            finally:
-                await page.close()
+        page = await self.acquire_page(download_dir)
+        try:
+            yield page
+        finally:
+            await self.release_page(page)
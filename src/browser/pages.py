@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List
+from urllib.parse import urljoin
 
 from loguru import logger
 from playwright.async_api import Locator, Page
 
+_NON_ALNUM = re.compile(r"[^0-9A-Za-z]+")
+
 
 @dataclass(slots=True)
 class LoginSelectors:
@@ -47,13 +51,34 @@ class LoginPage:
 
     async def goto(self, url: str) -> None:
         logger.debug("Navigating to {}", url)
-        await self.page.goto(url)
+        # Don't wait for the full load event; callers synchronize on the
+        # login form instead.
+        await self.page.goto(url, wait_until="domcontentloaded")
 
     async def login(self, username: str, password: str) -> None:
         logger.debug("Attempting login for {}", username)
-        await self.page.fill(self.selectors.username_input, username)
-        await self.page.fill(self.selectors.password_input, password)
-        await self.page.click(self.selectors.login_button)
+        await self.page.locator(self.selectors.username_input).wait_for()
+        # Fill both fields and submit in one evaluate round-trip instead of
+        # three; input events keep framework-bound forms in sync.
+        await self.page.evaluate(
+            """(s) => {
+                const setValue = (selector, value) => {
+                    const input = document.querySelector(selector);
+                    input.value = value;
+                    input.dispatchEvent(new Event("input", { bubbles: true }));
+                };
+                setValue(s.usernameInput, s.username);
+                setValue(s.passwordInput, s.password);
+                document.querySelector(s.loginButton).click();
+            }""",
+            {
+                "usernameInput": self.selectors.username_input,
+                "username": username,
+                "passwordInput": self.selectors.password_input,
+                "password": password,
+                "loginButton": self.selectors.login_button,
+            },
+        )
 
     async def read_error(self) -> str | None:
         if not self.selectors.error_banner:
@@ -80,6 +105,7 @@ class AccountSummaryPage:
         self.page = page
         self.summary_selectors = selectors
         self.statement_selectors = statement_selectors
+        self._statements_tab_open = False
 
     async def capture_summary(self, output_dir: Path, account_id: str) -> Path:
         summary_locator = self.page.locator(self.summary_selectors.summary_section)
@@ -91,22 +117,61 @@ class AccountSummaryPage:
 
     async def list_accounts(self) -> List[Dict[str, str]]:
         rows = self.page.locator(self.summary_selectors.account_rows)
-        count = await rows.count()
-        accounts: List[Dict[str, str]] = []
-        for index in range(count):
-            row = rows.nth(index)
-            accounts.append(
-                {
-                    "name": await row.locator(self.summary_selectors.account_name).inner_text(),
-                    "number": await row.locator(self.summary_selectors.account_number).inner_text(),
-                    "balance": await row.locator(self.summary_selectors.account_balance).inner_text(),
-                }
-            )
-        return accounts
+        # One evaluate_all round-trip instead of three inner_text calls per row.
+        return await rows.evaluate_all(
+            """(nodes, sel) => nodes.map((node) => ({
+                name: node.querySelector(sel.name)?.innerText ?? "",
+                number: node.querySelector(sel.number)?.innerText ?? "",
+                balance: node.querySelector(sel.balance)?.innerText ?? "",
+            }))""",
+            {
+                "name": self.summary_selectors.account_name,
+                "number": self.summary_selectors.account_number,
+                "balance": self.summary_selectors.account_balance,
+            },
+        )
 
     async def open_statements_tab(self) -> None:
+        if self._statements_tab_open:
+            return
         logger.debug("Opening statements tab")
         await self.page.click(self.statement_selectors.tab_selector)
+        self._statements_tab_open = True
+
+    async def list_statement_targets(self) -> List[Dict[str, str]]:
+        """Return each statement row's date and download href in one round-trip."""
+        rows = self.page.locator(self.statement_selectors.statement_rows)
+        # The download control may be a button (no href); fall back to its
+        # enclosing anchor, then to any anchor in the row.
+        return await rows.evaluate_all(
+            """(nodes, sel) => nodes.map((node) => {
+                const control = node.querySelector(sel.download);
+                const anchor = control?.closest("a[href]") ?? node.querySelector("a[href]");
+                return {
+                    date: node.querySelector(sel.date)?.innerText ?? "",
+                    href: control?.getAttribute("href") ?? anchor?.getAttribute("href") ?? "",
+                };
+            })""",
+            {
+                "date": self.statement_selectors.date_cell,
+                "download": self.statement_selectors.download_button,
+            },
+        )
+
+    async def download_statement_by_href(
+        self, href: str, download_dir: Path, account_id: str, date_text: str
+    ) -> Path | None:
+        """Fetch a statement link over HTTP, reusing the context's cookies."""
+        url = urljoin(self.page.url, href)
+        safe_date = _NON_ALNUM.sub("_", date_text).strip("_")
+        target_path = download_dir / f"{account_id}_{safe_date}.pdf"
+        logger.debug("Downloading statement for {} from {}", account_id, url)
+        response = await self.page.request.get(url)
+        if not response.ok:
+            logger.warning("Statement download failed for {} (HTTP {})", account_id, response.status)
+            return None
+        target_path.write_bytes(await response.body())
+        return target_path
 
     async def download_latest_statement(self, download_dir: Path, account_id: str) -> Path | None:
         rows = self.page.locator(self.statement_selectors.statement_rows)
@@ -117,7 +182,7 @@ class AccountSummaryPage:
         first_row: Locator = rows.first
         download_button = first_row.locator(self.statement_selectors.download_button)
         date_text = await first_row.locator(self.statement_selectors.date_cell).inner_text()
-        safe_date = "".join(char if char.isalnum() else "_" for char in date_text)
+        safe_date = _NON_ALNUM.sub("_", date_text).strip("_")
         logger.debug("Downloading statement for {} dated {}", account_id, date_text)
         with self.page.expect_download() as download_info:
             await download_button.click()
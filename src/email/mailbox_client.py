@@ -3,28 +3,35 @@ from __future__ import annotations
 import contextlib
 import datetime as dt
 import email
-from typing import Optional
+import re
+from typing import Dict, Optional
 
-from imapclient import IMAPClient
+from imapclient import SEEN, IMAPClient
 from loguru import logger
 from tenacity import retry, retry_if_exception_type, stop_after_delay, wait_fixed
 
-from src.email.parser import extract_otp_from_email
+from src.email.parser import extract_otp_from_email, extract_otp_from_text
 from src.utils.config import MailboxConfig
 
 
 class MailboxClient:
     """Thin wrapper around IMAPClient to poll for OTP emails."""
 
+    # Re-enter IDLE well before the ~10 minute mark where servers drop it.
+    IDLE_CYCLE_SECONDS = 9 * 60
+
     def __init__(self, config: MailboxConfig) -> None:
         self.config = config
         self._client: Optional[IMAPClient] = None
+        self._otp_pattern = re.compile(config.otp_regex)
+        self._uid_cursors: Dict[Optional[str], int] = {}
 
     def connect(self) -> None:
         logger.debug("Connecting to IMAP server {}", self.config.host)
         self._client = IMAPClient(self.config.host, port=self.config.port, ssl=True)
         self._client.login(self.config.username, self.config.password)
         self._client.select_folder(self.config.folder)
+        self._uid_cursors = {}
 
     def disconnect(self) -> None:
         if self._client:
@@ -40,36 +47,75 @@ class MailboxClient:
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         self.disconnect()
 
-    def _search_query(self, since: Optional[dt.datetime], recipient: Optional[str]) -> list:
+    def _search_query(self, since: Optional[dt.datetime], recipient: Optional[str], last_seen_uid: int = 0) -> list:
         criteria = ["UNSEEN"]
-        if since:
-            criteria.extend(["SINCE", since.strftime("%d-%b-%Y")])
+        if last_seen_uid:
+            # UID cursor keeps repeat searches O(new messages); SINCE is only
+            # day-granular and rescans from midnight on every poll.
+            criteria.extend(["UID", f"{last_seen_uid + 1}:*"])
+        elif since:
+            # ON <today> lets the server use its date index for the common
+            # "OTP requested moments ago" case; SINCE covers older windows.
+            keyword = "ON" if since.date() == dt.datetime.now(dt.timezone.utc).date() else "SINCE"
+            criteria.extend([keyword, since.strftime("%d-%b-%Y")])
         if self.config.sender_filter:
             criteria.extend(["FROM", self.config.sender_filter])
         if recipient:
             criteria.extend(["TO", recipient])
         return criteria
 
+    @staticmethod
+    def _is_plain_text_body(structure) -> bool:
+        """True when BODY[TEXT] is a single part needing no transfer decoding."""
+        if structure is None or structure.is_multipart:
+            return False
+        encoding = structure[5] if len(structure) > 5 else None
+        return isinstance(encoding, bytes) and encoding.lower() in (b"7bit", b"8bit", b"binary")
+
+    def _extract_otp_from_uid(self, uid: int) -> Optional[str]:
+        """Parse one message for an OTP; BODY.PEEK avoids flipping \\Seen."""
+        raw_messages = self._client.fetch([uid], [b"BODY.PEEK[TEXT]", b"BODYSTRUCTURE"])
+        body = raw_messages[uid].get(b"BODY[TEXT]")
+        # Only trust the raw scan on single-part plain bodies: for multipart
+        # or base64/quoted-printable messages BODY[TEXT] contains encoded
+        # payloads where digit runs can masquerade as OTPs.
+        if body and self._is_plain_text_body(raw_messages[uid].get(b"BODYSTRUCTURE")):
+            otp = extract_otp_from_text(body.decode("utf-8", errors="ignore"), self._otp_pattern)
+            if otp:
+                return otp
+        # Encoded/multipart bodies need the full message parse; BODY.PEEK[]
+        # still leaves \Seen untouched.
+        raw_messages = self._client.fetch([uid], [b"BODY.PEEK[]"])
+        raw_email = raw_messages[uid].get(b"BODY[]")
+        if raw_email is None:
+            return None
+        return extract_otp_from_email(email.message_from_bytes(raw_email), self._otp_pattern)
+
     def fetch_latest_otp(self, recipient: Optional[str] = None, since: Optional[dt.datetime] = None) -> Optional[str]:
         if not self._client:
             raise RuntimeError("IMAP client not connected")
 
         logger.debug("Polling mailbox for OTP (recipient={}, since={})", recipient, since)
-        message_uids = self._client.search(self._search_query(since, recipient))
+        cursor = self._uid_cursors.get(recipient, 0)
+        message_uids = self._client.search(self._search_query(since, recipient, cursor))
         if not message_uids:
             logger.debug("No new OTP messages found yet")
             return None
 
-        # fetch newest first
-        latest_uid = max(message_uids)
-        raw_messages = self._client.fetch([latest_uid], ["RFC822"])
-        raw_email = raw_messages[latest_uid][b"RFC822"]
-        email_message = email.message_from_bytes(raw_email)
-        otp = extract_otp_from_email(email_message, self.config.otp_regex)
-        if otp:
-            logger.info("Extracted OTP for {} from UID {}", recipient or "unknown recipient", latest_uid)
+        # Scan every new message newest-first so the freshest OTP wins, then
+        # advance this recipient's cursor; anything older than a hit is stale.
+        otp = None
+        for uid in sorted(message_uids, reverse=True):
+            otp = self._extract_otp_from_uid(uid)
+            if otp:
+                # Mark the message processed so UNSEEN keeps meaning "not yet
+                # handled" for later searches and runs.
+                self._client.add_flags([uid], [SEEN])
+                logger.info("Extracted OTP for {} from UID {}", recipient or "unknown recipient", uid)
+                break
         else:
-            logger.warning("Failed to parse OTP from UID {}", latest_uid)
+            logger.warning("Failed to parse OTP from {} new message(s)", len(message_uids))
+        self._uid_cursors[recipient] = max(cursor, max(message_uids))
         return otp
 
     @retry(
@@ -84,6 +130,13 @@ class MailboxClient:
 
     def poll_for_otp(self, recipient: Optional[str] = None, since: Optional[dt.datetime] = None) -> Optional[str]:
         self.assert_connected()
+        if self.config.use_idle and self._client.has_capability("IDLE"):
+            return self._poll_with_idle(recipient, since)
+        if self.config.use_idle:
+            logger.debug("Server does not advertise IDLE; falling back to sleep polling")
+        return self._poll_with_sleep(recipient, since)
+
+    def _poll_with_sleep(self, recipient: Optional[str], since: Optional[dt.datetime]) -> Optional[str]:
         import time
 
         deadline = dt.datetime.now(dt.timezone.utc) + dt.timedelta(seconds=self.config.poll_timeout)
@@ -95,3 +148,28 @@ class MailboxClient:
             time.sleep(self.config.poll_interval)
         logger.error("OTP polling timed out after {} seconds", self.config.poll_timeout)
         return None
+
+    def _poll_with_idle(self, recipient: Optional[str], since: Optional[dt.datetime]) -> Optional[str]:
+        assert self._client is not None
+        deadline = dt.datetime.now(dt.timezone.utc) + dt.timedelta(seconds=self.config.poll_timeout)
+
+        # The message may already be waiting before we enter IDLE.
+        otp = self.fetch_latest_otp(recipient, since)
+        if otp:
+            return otp
+
+        while True:
+            remaining = (deadline - dt.datetime.now(dt.timezone.utc)).total_seconds()
+            if remaining <= 0:
+                break
+            self._client.idle()
+            try:
+                responses = self._client.idle_check(timeout=min(remaining, self.IDLE_CYCLE_SECONDS))
+            finally:
+                self._client.idle_done()
+            if any(len(resp) > 1 and resp[1] == b"EXISTS" for resp in responses):
+                otp = self.fetch_latest_otp(recipient, since)
+                if otp:
+                    return otp
+        logger.error("OTP polling timed out after {} seconds", self.config.poll_timeout)
+        return None
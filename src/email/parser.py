@@ -1,36 +1,60 @@
 from __future__ import annotations
 
+import functools
 import re
 from email.message import EmailMessage
-from typing import Iterable, Optional
+from typing import Iterator, Optional
 
 OTP_DEFAULT_REGEX = re.compile(r"\b(\d{6})\b")
 
+# Cap how much of a body the regex may scan so a pathological pattern over a
+# bulky HTML payload cannot pin the CPU.
+OTP_SCAN_LIMIT = 64 * 1024
+
+# Cap how many bytes of a single MIME part get decoded.
+PART_DECODE_LIMIT = 256 * 1024
+
+
+@functools.lru_cache(maxsize=32)
+def _get_regex(pattern: str) -> re.Pattern[str]:
+    return re.compile(pattern)
+
 
 def extract_otp_from_text(text: str, pattern: str | re.Pattern[str] | None = None) -> Optional[str]:
     if not text:
         return None
-    regex = re.compile(pattern) if isinstance(pattern, str) else (pattern or OTP_DEFAULT_REGEX)
-    match = regex.search(text)
+    regex = _get_regex(pattern) if isinstance(pattern, str) else (pattern or OTP_DEFAULT_REGEX)
+    match = regex.search(text[:OTP_SCAN_LIMIT])
     if match:
         return match.group(1)
     return None
 
 
+def _decode_part(part: EmailMessage) -> Optional[str]:
+    payload = part.get_payload(decode=True)
+    if payload is None:
+        return None
+    return payload[:PART_DECODE_LIMIT].decode(part.get_content_charset("utf-8"), errors="ignore")
+
+
+def _iter_payloads(message: EmailMessage) -> Iterator[str]:
+    """Yield decoded bodies lazily, preferring text/plain parts over text/html."""
+    if not message.is_multipart():
+        text = _decode_part(message)
+        if text is not None:
+            yield text
+        return
+    for content_type in ("text/plain", "text/html"):
+        for part in message.walk():
+            if part.get_content_type() != content_type:
+                continue
+            text = _decode_part(part)
+            if text is not None:
+                yield text
+
+
 def extract_otp_from_email(message: EmailMessage, pattern: str | re.Pattern[str] | None = None) -> Optional[str]:
-    payloads: Iterable[str] = []
-    if message.is_multipart():
-        payloads = (
-            part.get_payload(decode=True).decode(part.get_content_charset("utf-8"), errors="ignore")
-            for part in message.walk()
-            if part.get_content_type() in {"text/plain", "text/html"}
-        )
-    else:
-        payloads = [
-            message.get_payload(decode=True).decode(message.get_content_charset("utf-8"), errors="ignore")
-        ]
-
-    for payload in payloads:
+    for payload in _iter_payloads(message):
         otp = extract_otp_from_text(payload, pattern)
         if otp:
             return otp
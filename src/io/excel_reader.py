@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Iterable, Iterator, List, Optional
 
 import pandas as pd
 from loguru import logger
@@ -24,11 +24,23 @@ class ExcelAccountReader:
         self.sheet_name = sheet_name
 
     def read(self) -> List[AccountRecord]:
+        accounts = list(self._iter_records())
+        logger.info("Loaded {} account(s) from Excel", len(accounts))
+        return accounts
+
+    def _iter_records(self) -> Iterator[AccountRecord]:
         if not self.path.exists():
             raise FileNotFoundError(f"Account workbook not found: {self.path}")
 
         logger.debug("Loading accounts from {}", self.path)
-        df = pd.read_excel(self.path, sheet_name=self.sheet_name).fillna("")
+        try:
+            # calamine parses the sheet without openpyxl's DOM overhead;
+            # dtype=str skips per-cell type inference entirely.
+            df = pd.read_excel(self.path, sheet_name=self.sheet_name, engine="calamine", dtype=str)
+        except (ImportError, ValueError):
+            logger.debug("calamine engine unavailable, falling back to openpyxl")
+            df = pd.read_excel(self.path, sheet_name=self.sheet_name, engine="openpyxl", dtype=str)
+        df = df.fillna("")
 
         required_columns = {"username", "password"}
         missing_cols = required_columns - {c.lower() for c in df.columns}
@@ -36,32 +48,26 @@ class ExcelAccountReader:
             raise ValueError(f"Missing required columns in spreadsheet: {missing_cols}")
 
         normalized_df = df.rename(columns=str.lower)
-
-        accounts: List[AccountRecord] = []
-        for _, row in normalized_df.iterrows():
-            username = str(row.get("username", "")).strip()
-            password = str(row.get("password", "")).strip()
-            if not username or not password:
-                logger.warning("Skipping row with missing credentials: {}", row.to_dict())
-                continue
-
-            metadata = {
-                key: row[key]
-                for key in normalized_df.columns
-                if key not in {"username", "password"} and row.get(key, "")
-            }
-
-            accounts.append(
-                AccountRecord(
-                    username=username,
-                    password=password,
-                    email=str(row.get("email", "")).strip() or None,
-                    metadata=metadata or None,
-                )
+        for column in ("username", "password"):
+            normalized_df[column] = normalized_df[column].astype(str).str.strip()
+
+        mask = normalized_df["username"].ne("") & normalized_df["password"].ne("")
+        skipped = int((~mask).sum())
+        if skipped:
+            logger.warning("Skipping {} row(s) with missing credentials", skipped)
+
+        for record in normalized_df[mask].to_dict(orient="records"):
+            yield AccountRecord(
+                username=record["username"],
+                password=record["password"],
+                email=str(record.get("email", "")).strip() or None,
+                metadata={
+                    key: value
+                    for key, value in record.items()
+                    if key not in {"username", "password"} and value
+                }
+                or None,
             )
 
-        logger.info("Loaded {} account(s) from Excel", len(accounts))
-        return accounts
-
     def iter_accounts(self) -> Iterable[AccountRecord]:
-        yield from self.read()
+        return self._iter_records()
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import csv
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, List, Sequence
+from typing import Iterable, List, Optional, Sequence, TextIO
 
 from loguru import logger
 
@@ -24,30 +25,59 @@ class ResultsWriter:
 
     def __init__(self, csv_path: Path | str) -> None:
         self.csv_path = Path(csv_path)
+        self._fp: Optional[TextIO] = None
+        self._writer = None
+        # Serializes writers running in asyncio.to_thread workers.
+        self._lock = threading.Lock()
 
-    def initialize(self) -> None:
-        if not self.csv_path.exists():
-            logger.debug("Initializing results CSV at {}", self.csv_path)
-            self.csv_path.parent.mkdir(parents=True, exist_ok=True)
-            with self.csv_path.open("w", newline="", encoding="utf-8") as fp:
-                writer = csv.writer(fp)
-                writer.writerow(self.HEADER)
+    def _ensure_open(self) -> None:
+        if self._fp is not None:
+            return
+        self.csv_path.parent.mkdir(parents=True, exist_ok=True)
+        is_new = not self.csv_path.exists()
+        logger.debug("Opening results CSV at {}", self.csv_path)
+        self._fp = self.csv_path.open("a", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._fp)
+        if is_new:
+            self._writer.writerow(self.HEADER)
+
+    def open(self) -> None:
+        with self._lock:
+            self._ensure_open()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fp is not None:
+                self._fp.close()
+                self._fp = None
+                self._writer = None
+
+    def __enter__(self) -> "ResultsWriter":
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    @staticmethod
+    def _to_row(result: ResultRecord) -> List[str]:
+        return [
+            result.username,
+            result.status,
+            result.details,
+            ";".join(result.screenshots),
+            ";".join(result.statements),
+        ]
 
     def append(self, result: ResultRecord) -> None:
-        self.initialize()
-        logger.debug("Recording result for {}", result.username)
-        with self.csv_path.open("a", newline="", encoding="utf-8") as fp:
-            writer = csv.writer(fp)
-            writer.writerow(
-                [
-                    result.username,
-                    result.status,
-                    result.details,
-                    ";".join(result.screenshots),
-                    ";".join(result.statements),
-                ]
-            )
+        with self._lock:
+            self._ensure_open()
+            logger.debug("Recording result for {}", result.username)
+            self._writer.writerow(self._to_row(result))
+            self._fp.flush()
 
     def append_many(self, results: Iterable[ResultRecord]) -> None:
-        for result in results:
-            self.append(result)
+        with self._lock:
+            self._ensure_open()
+            self._writer.writerows(self._to_row(result) for result in results)
+            self._fp.flush()
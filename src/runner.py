@@ -58,49 +58,66 @@ class AutomationRunner:
         if headless_override is not None:
             self.config.browser.headless = headless_override
 
+        # Unpack selector dataclasses once; unknown/missing keys fail here
+        # rather than midway through the first account.
+        self._login_selectors = LoginSelectors(**selectors["login"])
+        self._otp_selectors = OtpSelectors(**selectors["otp"])
+        self._summary_selectors = SummarySelectors(**selectors["summary"])
+        self._statement_selectors = StatementSelectors(**selectors["statements"])
+
         self.browser_manager = BrowserManager(self.config)
         self.mailbox_client = MailboxClient(self.config.mailbox)
         self.results_writer = ResultsWriter(self.config.outputs.results_csv)
+        self._mailbox_lock = asyncio.Lock()
 
     async def run(self) -> None:
         accounts = self._load_accounts()
+        if self.limit and len(accounts) > self.limit:
+            logger.info("Applying configured account limit ({}).", self.limit)
+            accounts = accounts[: self.limit]
         logger.info("Starting automation for {} account(s)", len(accounts))
 
+        semaphore = asyncio.Semaphore(self.config.max_concurrency)
+
+        async def _guarded(account: AccountRecord) -> AccountOutcome:
+            async with semaphore:
+                outcome = await self._process_account(account)
+            # Persist each outcome as it lands so a crash mid-run keeps the
+            # rows for every account already finished; the writer's lock
+            # serializes the to_thread workers.
+            await asyncio.to_thread(self.results_writer.append, outcome.to_result_record())
+            return outcome
+
         try:
             await self.browser_manager.start()
-            with self.mailbox_client:
-                outcomes = []
-                for idx, account in enumerate(accounts, start=1):
-                    if self.limit and idx > self.limit:
-                        logger.info("Hit configured account limit ({}). Stopping.", self.limit)
-                        break
-                    outcome = await self._process_account(account)
-                    outcomes.append(outcome)
-                    self.results_writer.append(outcome.to_result_record())
+            with self.results_writer, self.mailbox_client:
+                await asyncio.gather(*(_guarded(account) for account in accounts))
         finally:
             await self.browser_manager.stop()
 
     def _load_accounts(self) -> List[AccountRecord]:
         reader = ExcelAccountReader(self.config.excel_path)
-        accounts = reader.read()
         if self.single_account:
-            accounts = [acc for acc in accounts if acc.username == self.single_account]
+            account = next(
+                (acc for acc in reader.iter_accounts() if acc.username == self.single_account),
+                None,
+            )
+            if account is None:
+                raise RuntimeError("No accounts available for processing.")
+            return [account]
+        accounts = reader.read()
         if not accounts:
             raise RuntimeError("No accounts available for processing.")
         return accounts
 
     def _build_login_page(self, page) -> LoginPage:
-        login_selectors = LoginSelectors(**self.selectors["login"])
-        return LoginPage(page, login_selectors)
+        return LoginPage(page, self._login_selectors)
 
     def _build_otp_page(self, page) -> OtpPage:
-        otp_selectors = OtpSelectors(**self.selectors["otp"])
-        return OtpPage(page, otp_selectors)
+        return OtpPage(page, self._otp_selectors)
 
     def _build_summary_page(self, page) -> AccountSummaryPage:
-        summary_selectors = SummarySelectors(**self.selectors["summary"])
-        statement_selectors = StatementSelectors(**self.selectors["statements"])
-        return AccountSummaryPage(page, summary_selectors, statement_selectors)
+        return AccountSummaryPage(page, self._summary_selectors, self._statement_selectors)
 
     async def _process_account(self, account: AccountRecord) -> AccountOutcome:
         logger.info("Processing account {}", account.username)
@@ -113,19 +130,25 @@ class AutomationRunner:
         screenshot_dir.mkdir(parents=True, exist_ok=True)
 
         try:
-            async with self.browser_manager.page(download_dir) as page:
+            # Each account needs its own context so concurrent logins never
+            # share cookies or session state.
+            async with self.browser_manager.context(download_dir) as ctx:
+                page = await ctx.new_page()
                 login_page = self._build_login_page(page)
                 await login_page.goto(self.config.bank_base_url)
+                await page.wait_for_selector(self._login_selectors.username_input)
                 await login_page.login(account.username, account.password)
 
                 await page.wait_for_selector(self.selectors["otp"]["otp_input"])
                 otp_request_time = dt.datetime.now(dt.timezone.utc) - dt.timedelta(seconds=5)
 
-                otp = await asyncio.to_thread(
-                    self.mailbox_client.poll_for_otp,
-                    account.email or account.username,
-                    otp_request_time,
-                )
+                # IMAPClient is not thread-safe; serialize concurrent pollers.
+                async with self._mailbox_lock:
+                    otp = await asyncio.to_thread(
+                        self.mailbox_client.poll_for_otp,
+                        account.email or account.username,
+                        otp_request_time,
+                    )
                 if not otp:
                     error_details = "OTP timeout"
                     logger.error("Failed to retrieve OTP for {}: {}", account.username, error_details)
@@ -141,15 +164,37 @@ class AutomationRunner:
                 screenshots.append(str(summary_path))
 
                 accounts = await summary_page.list_accounts()
+                account_ids = []
                 for account_meta in accounts:
                     account_id = account_meta.get("number", "unknown").replace(" ", "_")
+                    account_ids.append(account_id)
                     account_path = await summary_page.capture_summary(screenshot_dir, account_id)
                     screenshots.append(str(account_path))
 
-                    await summary_page.open_statements_tab()
-                    statement_path = await summary_page.download_latest_statement(download_dir, account_id)
-                    if statement_path:
-                        statements.append(str(statement_path))
+                await summary_page.open_statements_tab()
+                targets = await summary_page.list_statement_targets()
+                latest = targets[0] if targets else None
+                if latest and latest.get("href"):
+                    statement_sem = asyncio.Semaphore(4)
+
+                    async def _download_latest(account_id: str):
+                        async with statement_sem:
+                            return await summary_page.download_statement_by_href(
+                                latest["href"], download_dir, account_id, latest.get("date", "")
+                            )
+
+                    statement_paths = await asyncio.gather(
+                        *(_download_latest(aid) for aid in account_ids)
+                    )
+                else:
+                    # JS-driven download buttons have no href to fetch, and
+                    # expect_download + click on one shared page cannot be
+                    # safely interleaved, so run the fallback serially.
+                    statement_paths = [
+                        await summary_page.download_latest_statement(download_dir, aid)
+                        for aid in account_ids
+                    ]
+                statements.extend(str(path) for path in statement_paths if path)
 
             logger.success("Completed account {}", account.username)
             return AccountOutcome(account, status="SUCCESS", screenshots=screenshots, statements=statements)
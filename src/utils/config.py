@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import os
+import re
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, Optional
@@ -21,6 +22,7 @@ class MailboxConfig:
     otp_regex: str = r"\b(\d{6})\b"
     poll_timeout: int = 60
     poll_interval: float = 5.0
+    use_idle: bool = True
 
 
 @dataclass(slots=True)
@@ -29,6 +31,7 @@ class BrowserConfig:
     download_wait_seconds: int = 30
     viewport_width: int = 1280
     viewport_height: int = 720
+    blocked_resource_types: frozenset[str] = frozenset({"image", "font", "media"})
 
 
 @dataclass(slots=True)
@@ -40,10 +43,8 @@ class OutputConfig:
     log_file: Path
 
     def ensure_directories(self) -> None:
-        for path in {self.root_dir, self.screenshots_dir, self.statements_dir, self.log_file.parent}:
-            if not path.exists():
-                logger.debug("Creating output directory {}", path)
-                path.mkdir(parents=True, exist_ok=True)
+        for path in (self.root_dir, self.screenshots_dir, self.statements_dir, self.log_file.parent):
+            path.mkdir(parents=True, exist_ok=True)
 
 
 @dataclass(slots=True)
@@ -55,6 +56,7 @@ class AppConfig:
     outputs: OutputConfig
     log_level: str = "INFO"
     max_accounts: int = 0
+    max_concurrency: int = 4
 
     @property
     def selectors_config(self) -> Dict[str, Any]:
@@ -67,6 +69,22 @@ class AppConfig:
         setattr(self, "_selectors", selectors)
 
 
+# Quantified group itself followed by an unbounded quantifier, e.g. (.+)+ or
+# (\d*)* — the classic catastrophic-backtracking shape.
+_NESTED_QUANTIFIER_RE = re.compile(r"\([^()]*(?:[+*]|\{\d+,\}\??)[^()]*\)(?:[+*]|\{\d+,\})")
+
+
+def _validate_otp_regex(pattern: str) -> str:
+    """Reject OTP patterns prone to catastrophic backtracking before they reach the poller."""
+    try:
+        re.compile(pattern)
+    except re.error as exc:
+        raise ValueError(f"Invalid IMAP_OTP_REGEX: {exc}") from exc
+    if _NESTED_QUANTIFIER_RE.search(pattern):
+        raise ValueError("IMAP_OTP_REGEX contains nested unbounded quantifiers (ReDoS risk)")
+    return pattern
+
+
 def _coerce_bool(value: str | bool) -> bool:
     if isinstance(value, bool):
         return value
@@ -102,9 +120,10 @@ def load_config(env_file: Optional[Path] = None) -> AppConfig:
         port=int(env.get("IMAP_PORT", 993)),
         folder=env.get("IMAP_FOLDER", "INBOX"),
         sender_filter=env.get("IMAP_SENDER_FILTER"),
-        otp_regex=env.get("IMAP_OTP_REGEX", r"\b(\d{6})\b"),
+        otp_regex=_validate_otp_regex(env.get("IMAP_OTP_REGEX", r"\b(\d{6})\b")),
         poll_timeout=int(env.get("IMAP_POLL_TIMEOUT", 60)),
         poll_interval=float(env.get("IMAP_POLL_INTERVAL", 5)),
+        use_idle=_coerce_bool(env.get("IMAP_USE_IDLE", "true")),
     )
 
     browser = BrowserConfig(
@@ -112,6 +131,11 @@ def load_config(env_file: Optional[Path] = None) -> AppConfig:
         download_wait_seconds=int(env.get("DOWNLOAD_WAIT_SECONDS", 30)),
         viewport_width=int(env.get("DEFAULT_VIEWPORT_WIDTH", 1280)),
         viewport_height=int(env.get("DEFAULT_VIEWPORT_HEIGHT", 720)),
+        blocked_resource_types=frozenset(
+            part.strip()
+            for part in env.get("BLOCK_RESOURCES", "image,font,media").split(",")
+            if part.strip()
+        ),
     )
 
     outputs = OutputConfig(
@@ -130,6 +154,7 @@ def load_config(env_file: Optional[Path] = None) -> AppConfig:
         outputs=outputs,
         log_level=env.get("LOG_LEVEL", "INFO"),
         max_accounts=int(env.get("MAX_ACCOUNTS", 0)),
+        max_concurrency=int(env.get("MAX_CONCURRENCY", 4)),
     )
 
     outputs.ensure_directories()
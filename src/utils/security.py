@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Iterator, Tuple
 
-SENSITIVE_KEYS = {"password", "otp", "token", "secret"}
+SENSITIVE_KEYS = frozenset({"password", "otp", "token", "secret"})
 
 
 @dataclass(slots=True)
@@ -17,10 +18,13 @@ class Redaction:
         return f"{value[:2]}{self.mask}{value[-2:]}"
 
 
+def iter_redacted(payload: dict, redaction: Redaction | None = None) -> Iterator[Tuple[str, object]]:
+    """Yield (key, value) pairs with sensitive keys masked, without building a dict."""
+    redaction = redaction or Redaction()
+    for key, value in payload.items():
+        yield key, redaction.redact(value) if key.lower() in SENSITIVE_KEYS else value
+
+
 def redact_dict(payload: dict, redaction: Redaction | None = None) -> dict:
     """Return a shallow copy with sensitive keys masked."""
-    redaction = redaction or Redaction()
-    return {
-        key: redaction.redact(value) if key.lower() in SENSITIVE_KEYS else value
-        for key, value in payload.items()
-    }
+    return dict(iter_redacted(payload, redaction))
@@ -0,0 +1,22 @@
+import pytest
+
+from src.utils.config import _validate_otp_regex
+
+
+def test_validate_otp_regex_accepts_default():
+    assert _validate_otp_regex(r"\b(\d{6})\b") == r"\b(\d{6})\b"
+
+
+def test_validate_otp_regex_accepts_custom_pattern():
+    assert _validate_otp_regex(r"code[:\s]+(\d{4,8})") == r"code[:\s]+(\d{4,8})"
+
+
+@pytest.mark.parametrize("pattern", [r"(.+)+", r"(.*)*", r"(\d{2,})+"])
+def test_validate_otp_regex_rejects_nested_quantifiers(pattern):
+    with pytest.raises(ValueError, match="ReDoS"):
+        _validate_otp_regex(pattern)
+
+
+def test_validate_otp_regex_rejects_invalid_syntax():
+    with pytest.raises(ValueError, match="Invalid IMAP_OTP_REGEX"):
+        _validate_otp_regex("(")
@@ -15,3 +15,10 @@ def test_extract_otp_from_email():
     message = EmailMessage()
     message.set_content("OTP: 654321")
     assert extract_otp_from_email(message) == "654321"
+
+
+def test_extract_otp_from_email_prefers_plain_over_html():
+    message = EmailMessage()
+    message.set_content("<html><body>OTP: 222222</body></html>", subtype="html")
+    message.add_alternative("OTP: 111111")
+    assert extract_otp_from_email(message) == "111111"